@@ -1,7 +1,7 @@
 """AletheiaFact API client with OAuth2 authentication via Ory Hydra"""
 import httpx
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
 import logging
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
@@ -10,6 +10,31 @@ from app.services.ory_auth import ory_auth
 
 logger = logging.getLogger(__name__)
 
+# Shared HTTP client so submissions reuse pooled keep-alive connections
+# (created on first use, closed on application shutdown)
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client, creating it on first use.
+
+    Returns:
+        httpx.AsyncClient reused for all AletheiaFact requests
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(timeout=30.0)
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared HTTP client (called on application shutdown)"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 class AletheiaClient:
     """Client for interacting with AletheiaFact API using OAuth2"""
@@ -66,22 +91,22 @@ class AletheiaClient:
         payload = {k: v for k, v in payload.items() if v is not None}
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/api/verification-request",
-                    json=payload,
-                    headers={
-                        'Authorization': f'Bearer {access_token}',  # OAuth2 token
-                        'Content-Type': 'application/json'
-                    },
-                    timeout=30.0
-                )
-
-                response.raise_for_status()
-                result = response.json()
-
-                logger.info(f"Successfully created verification request: {result.get('_id', 'unknown')}")
-                return result
+            client = _get_http_client()
+            response = await client.post(
+                f"{self.base_url}/api/verification-request",
+                json=payload,
+                headers={
+                    'Authorization': f'Bearer {access_token}',  # OAuth2 token
+                    'Content-Type': 'application/json'
+                },
+                timeout=30.0
+            )
+
+            response.raise_for_status()
+            result = response.json()
+
+            logger.info(f"Successfully created verification request: {result.get('_id', 'unknown')}")
+            return result
 
         except httpx.HTTPStatusError as e:
             error_msg = f"VR creation failed: {e.response.status_code}"
@@ -9,6 +9,9 @@ class Settings(BaseSettings):
     # MongoDB Configuration
     mongodb_url: str = "mongodb://localhost:27017"
     database_name: str = "monitoring_poc"
+    mongodb_max_pool_size: int = 50  # Connections shared by API routes and scheduled jobs
+    mongodb_min_pool_size: int = 5  # Connections kept open between extraction runs
+    mongodb_compressors: Optional[str] = None  # e.g. "zstd,snappy,zlib" (zstd/snappy need extra packages)
 
     # Logging
     log_level: str = "info"
@@ -27,13 +30,18 @@ class Settings(BaseSettings):
 
     # Scheduler
     extraction_interval_minutes: int = 30  # How often to extract content from sources
+    extraction_concurrency: int = 10  # Max sources fetched at the same time
 
     # Filtering and Submission
     minimum_save_score: int = 20  # Minimum score to save content to database
     submission_score_threshold: int = 38  # Minimum score to submit to AletheiaFact (increased from 35)
     max_batch_submission: int = 100
+    submission_concurrency: int = 5  # Max submissions in flight to AletheiaFact at once
     auto_submit_enabled: bool = False  # Enable/disable automatic submission after extraction
 
+    # API
+    stats_cache_ttl_seconds: int = 15  # How long /api/stats responses are reused (0 disables)
+
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -9,12 +9,14 @@ from app.constants.keywords import (
     ENTERTAINMENT_KEYWORDS,
     SPORTS_KEYWORDS,
     CONTROVERSY_KEYWORDS,
+    GOVERNMENT_FUNDING_KEYWORDS,
     SPECULATION_KEYWORDS,
     VAGUE_QUANTIFIERS,
     OFFICIAL_GUIDANCE_KEYWORDS,
     HEALTH_SAFETY_ADVISORY,
     VAGUE_KEYWORDS,
-    NOISE_TERMS
+    NOISE_TERMS,
+    SENTENCE_NOISE_PHRASES
 )
 from app.constants.patterns import (
     PERCENTAGE_PATTERN,
@@ -24,14 +26,23 @@ from app.constants.patterns import (
     DATE_PATTERN,
     YEAR_PATTERN,
     NUMBER_PATTERN,
+    QUOTED_TEXT_PATTERN,
+    PROPER_NOUN_PATTERN,
     SENTENCE_DELIMITER_PATTERN,
     CONDITIONAL_PATTERN,
-    NOISE_PATTERNS,
+    GOVERNMENT_ENTITY_PATTERN,
+    OPINION_PATTERNS,
+    LEADING_PRONOUN_PATTERN,
+    SENTENCE_BOUNDARY_PATTERN,
+    PARAGRAPH_BREAK_PATTERN,
+    ENTITY_VERB_QUE_VERBS,
     PATTERN_ENTITY_VERB_QUE,
     PATTERN_SEGUNDO,
     PATTERN_DE_ACORDO_COM,
     PATTERN_CONFORME,
+    ENTITY_VERB_COLON_VERBS,
     PATTERN_ENTITY_VERB_COLON,
+    ENTITY_ACTION_VERBS,
     PATTERN_ENTITY_ACTION,
     PATTERN_DIRECT_QUOTE,
     PATTERN_DATA_AFFIRMATION
@@ -52,12 +63,14 @@ __all__ = [
     "ENTERTAINMENT_KEYWORDS",
     "SPORTS_KEYWORDS",
     "CONTROVERSY_KEYWORDS",
+    "GOVERNMENT_FUNDING_KEYWORDS",
     "SPECULATION_KEYWORDS",
     "VAGUE_QUANTIFIERS",
     "OFFICIAL_GUIDANCE_KEYWORDS",
     "HEALTH_SAFETY_ADVISORY",
     "VAGUE_KEYWORDS",
     "NOISE_TERMS",
+    "SENTENCE_NOISE_PHRASES",
     # Patterns
     "PERCENTAGE_PATTERN",
     "CURRENCY_BRL_PATTERN",
@@ -66,14 +79,23 @@ __all__ = [
     "DATE_PATTERN",
     "YEAR_PATTERN",
     "NUMBER_PATTERN",
+    "QUOTED_TEXT_PATTERN",
+    "PROPER_NOUN_PATTERN",
     "SENTENCE_DELIMITER_PATTERN",
     "CONDITIONAL_PATTERN",
-    "NOISE_PATTERNS",
+    "GOVERNMENT_ENTITY_PATTERN",
+    "OPINION_PATTERNS",
+    "LEADING_PRONOUN_PATTERN",
+    "SENTENCE_BOUNDARY_PATTERN",
+    "PARAGRAPH_BREAK_PATTERN",
+    "ENTITY_VERB_QUE_VERBS",
     "PATTERN_ENTITY_VERB_QUE",
     "PATTERN_SEGUNDO",
     "PATTERN_DE_ACORDO_COM",
     "PATTERN_CONFORME",
+    "ENTITY_VERB_COLON_VERBS",
     "PATTERN_ENTITY_VERB_COLON",
+    "ENTITY_ACTION_VERBS",
     "PATTERN_ENTITY_ACTION",
     "PATTERN_DIRECT_QUOTE",
     "PATTERN_DATA_AFFIRMATION",
@@ -181,6 +181,12 @@ CONTROVERSY_KEYWORDS = {
     'propina', 'desvio', 'irregularidade', 'ilegal'
 }
 
+# Government money/investment context that overrides the entertainment penalty
+# (e.g., "Ministério da Cultura investiu R$ 10 milhões no festival")
+GOVERNMENT_FUNDING_KEYWORDS = {
+    'governo', 'ministério', 'federal', 'investiu', 'investimento'
+}
+
 # ============================================================================
 # VAGUE LANGUAGE & OFFICIAL GUIDANCE (Scoring Modifiers)
 # ============================================================================
@@ -227,8 +233,24 @@ VAGUE_KEYWORDS = {
 }
 
 # Pure noise terms (navigation, CTAs, metadata)
-NOISE_TERMS = [
+NOISE_TERMS = {
     'clique aqui', 'clique para', 'veja mais', 'saiba mais',
     'leia mais', 'acesse', 'confira', 'veja também',
     'notícias do dia', 'últimas notícias'
-]
+}
+
+# Sentence noise phrases (used by claim_extractor - instant disqualification)
+# Plain substrings of the lowercased sentence: checking them with `in` is
+# faster than running the equivalent regex alternations
+SENTENCE_NOISE_PHRASES = (
+    # Navigation / read-more links
+    'clique aqui', 'clique para', 'saiba mais', 'leia também', 'leia mais',
+    'veja também', 'veja mais', 'veja galeria', 'veja vídeo', 'confira', 'assista',
+    # Social media
+    'whatsapp', 'facebook', 'instagram', 'twitter', 'telegram',
+    'compartilhe', 'curta', 'inscreva-se', 'siga o', 'siga a', 'siga nosso',
+    # Media credits
+    'foto:', 'imagem:', 'crédito:', 'reprodução', 'divulgação',
+    # App CTAs
+    'baixe o app', 'download', '📱', 'aplicativo g1',
+)
@@ -6,18 +6,33 @@ This module contains all regex patterns used by:
 """
 import re
 
+from app.constants.keywords import GOVERNMENT_ENTITIES
+
 # ============================================================================
 # DATA DETECTION PATTERNS
 # ============================================================================
+# Callers always search lowercased text, so these patterns are written in
+# lowercase and compiled without re.IGNORECASE (case folding disables the
+# literal-prefix fast path for r$/us$)
+_MAGNITUDE = r'(mil|milhões|bilhões|milhão|bilhão)'
+
 PERCENTAGE_PATTERN = re.compile(r'\d+([,\.]\d+)?%')
-CURRENCY_BRL_PATTERN = re.compile(r'r\$\s*[\d\.,]+\s*(mil|milhões|bilhões|milhão|bilhão)?', re.IGNORECASE)
-CURRENCY_USD_PATTERN = re.compile(r'us\$\s*[\d\.,]+\s*(mil|milhões|bilhões|milhão|bilhão)?', re.IGNORECASE)
-LARGE_NUMBER_PATTERN = re.compile(r'\d+\s*(mil|milhões|bilhões|milhão|bilhão)', re.IGNORECASE)
-DATE_PATTERN = re.compile(r'\d{1,2}\s+de\s+(janeiro|fevereiro|março|abril|maio|junho|julho|agosto|setembro|outubro|novembro|dezembro)', re.IGNORECASE)
+CURRENCY_BRL_PATTERN = re.compile(r'r\$\s*[\d\.,]+\s*' + _MAGNITUDE + '?')
+CURRENCY_USD_PATTERN = re.compile(r'us\$\s*[\d\.,]+\s*' + _MAGNITUDE + '?')
+LARGE_NUMBER_PATTERN = re.compile(r'\d+\s*' + _MAGNITUDE)
+DATE_PATTERN = re.compile(r'\d{1,2}\s+de\s+(janeiro|fevereiro|março|abril|maio|junho|julho|agosto|setembro|outubro|novembro|dezembro)')
 YEAR_PATTERN = re.compile(r'\b(19|20)\d{2}\b')
 NUMBER_PATTERN = re.compile(r'\d+')
 SENTENCE_DELIMITER_PATTERN = re.compile(r'[.!?]')
 
+# Quoted passage of 20+ characters (direct quotes)
+QUOTED_TEXT_PATTERN = re.compile(r'["""]\s*.{20,}\s*["""]')
+
+# Sequences of capitalized words (names of people/organizations)
+PROPER_NOUN_PATTERN = re.compile(
+    r'\b[A-ZÇÁÉÍÓÚÂÊÔÃÕ][a-zçáéíóúâêôãõ]+(?:\s+[A-ZÇÁÉÍÓÚÂÊÔÃÕ][a-zçáéíóúâêôãõ]+)+\b'
+)
+
 # ============================================================================
 # CONDITIONAL/SPECULATION PATTERNS
 # ============================================================================
@@ -29,26 +44,51 @@ CONDITIONAL_PATTERN = re.compile(
 )
 
 # ============================================================================
-# NOISE PATTERNS (to skip sentences entirely)
+# SENTENCE QUALITY PATTERNS (used on lowercased sentences)
 # ============================================================================
-NOISE_PATTERNS = [
-    re.compile(r'clique (aqui|para)|saiba mais|leia (também|mais)', re.IGNORECASE),
-    re.compile(r'veja (também|mais|galeria|vídeo)|confira|assista', re.IGNORECASE),
-    re.compile(r'(whatsapp|facebook|instagram|twitter|telegram)', re.IGNORECASE),
-    re.compile(r'compartilhe|curta|inscreva-se|siga (o|a|nosso)', re.IGNORECASE),
-    re.compile(r'foto:|imagem:|crédito:|reprodução|divulgação', re.IGNORECASE),
-    re.compile(r'baixe o app|download|📱|aplicativo g1', re.IGNORECASE),  # App CTAs
+# Any government entity in a single pass (faster than one substring scan per
+# entity on sentence-length text)
+GOVERNMENT_ENTITY_PATTERN = re.compile(
+    '|'.join(re.escape(entity) for entity in sorted(GOVERNMENT_ENTITIES))
+)
+
+# Opinion/subjective markers (checked in order, first match wins)
+OPINION_PATTERNS = [
+    re.compile(r'(acredito|acho|penso|imagino) que'),
+    re.compile(r'na minha (opinião|visão)'),
+    re.compile(r'(bonito|feio|lindo|horrível|incrível|maravilhoso|emocionante)'),
 ]
 
+# Sentences starting with pronouns without clear antecedent
+LEADING_PRONOUN_PATTERN = re.compile(r'^(ele|ela|eles|elas|isso|isto|aquilo)\s')
+
+# Sentence boundaries: runs of . ! ? except the dot of a common abbreviation
+# followed by whitespace ("Dr. Silva", "Sra. Lima"), which shouldn't split
+SENTENCE_BOUNDARY_PATTERN = re.compile(
+    r'[.!?]'
+    r'(?:(?<=[!?])|(?!\s)|(?<!\bDr\.)(?<!\bSr\.)(?<!\bSra\.)(?<!\bProf\.)(?<!\bGov\.))'
+    r'[.!?]*'
+)
+
+# Paragraph breaks in plain text (blank lines)
+PARAGRAPH_BREAK_PATTERN = re.compile(r'\n\s*\n')
+
 # ============================================================================
 # CLAIM ATTRIBUTION PATTERNS (Portuguese)
 # ============================================================================
+# The entity patterns (1, 5, 6) backtrack heavily on long sentences. Their
+# verb tuples are exported so callers can skip the regex entirely when none
+# of the verbs occurs in the (lowercased) text.
 
 # Pattern 1: "Entity + verb + que + claim"
 # Example: "O ministro afirmou que a inflação caiu"
+ENTITY_VERB_QUE_VERBS = (
+    'afirmou', 'disse', 'declarou', 'alegou', 'confirmou', 'negou',
+    'garantiu', 'revelou', 'anunciou', 'criticou', 'defendeu', 'acusou'
+)
 PATTERN_ENTITY_VERB_QUE = re.compile(
     r'([A-ZÇÁÉÍÓÚÂÊÔÃÕ][a-zçáéíóúâêôãõ\s]+?)\s+'
-    r'(afirmou|disse|declarou|alegou|confirmou|negou|garantiu|revelou|anunciou|criticou|defendeu|acusou)\s+'
+    r'(' + '|'.join(ENTITY_VERB_QUE_VERBS) + r')\s+'
     r'que\s+(.+?)(?:\.|$)',
     re.IGNORECASE
 )
@@ -76,17 +116,22 @@ PATTERN_CONFORME = re.compile(
 
 # Pattern 5: "Entity + verb: claim" (colon-separated)
 # Example: "Ministro garante: investimento será mantido"
+ENTITY_VERB_COLON_VERBS = ('garante', 'afirma', 'declara', 'anuncia', 'revela')
 PATTERN_ENTITY_VERB_COLON = re.compile(
     r'([A-ZÇÁÉÍÓÚÂÊÔÃÕ][a-zçáéíóúâêôãõ\s]+?)\s+'
-    r'(garante|afirma|declara|anuncia|revela):\s+(.+?)(?:\.|$)',
+    r'(' + '|'.join(ENTITY_VERB_COLON_VERBS) + r'):\s+(.+?)(?:\.|$)',
     re.IGNORECASE
 )
 
 # Pattern 6: "Entity + action verb + object" (no attribution verb)
 # Example: "Governo anuncia investimento de R$ 500 milhões"
+ENTITY_ACTION_VERBS = (
+    'anuncia', 'anunciou', 'aprova', 'aprovou', 'divulga', 'divulgou',
+    'publica', 'publicou', 'apresenta', 'apresentou'
+)
 PATTERN_ENTITY_ACTION = re.compile(
     r'([A-ZÇÁÉÍÓÚÂÊÔÃÕ][a-zçáéíóúâêôãõ\s]+?)\s+'
-    r'(anuncia|anunciou|aprova|aprovou|divulga|divulgou|publica|publicou|apresenta|apresentou)\s+'
+    r'(' + '|'.join(ENTITY_ACTION_VERBS) + r')\s+'
     r'(.+?)(?:\.|$)',
     re.IGNORECASE
 )
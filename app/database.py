@@ -16,7 +16,14 @@ class Database:
     async def connect(self):
         """Connect to MongoDB and setup indexes"""
         try:
-            self.client = AsyncIOMotorClient(settings.mongodb_url)
+            client_options = {
+                'maxPoolSize': settings.mongodb_max_pool_size,
+                'minPoolSize': settings.mongodb_min_pool_size,
+            }
+            if settings.mongodb_compressors:
+                client_options['compressors'] = settings.mongodb_compressors
+
+            self.client = AsyncIOMotorClient(settings.mongodb_url, **client_options)
             self.db = self.client[settings.database_name]
 
             # Test connection
@@ -44,6 +51,13 @@ class Database:
             IndexModel([("contentHash", ASCENDING)], unique=True),
             IndexModel([("sourceUrl", ASCENDING)]),  # For fast duplicate URL checks
             IndexModel([("status", ASCENDING), ("extractedAt", DESCENDING)]),
+            # Content listing: filter by status/source, newest first
+            IndexModel([("status", ASCENDING), ("sourceName", ASCENDING), ("extractedAt", DESCENDING)]),
+            IndexModel([("extractedAt", DESCENDING)]),
+            # Pending-submission batch query (highest scores first)
+            IndexModel([("status", ASCENDING), ("preFilterScore", DESCENDING)]),
+            # Latest submission lookup on the stats endpoint
+            IndexModel([("status", ASCENDING), ("submittedToAletheiaAt", DESCENDING)]),
             IndexModel([("preFilterScore", DESCENDING)]),
             IndexModel([("sourceName", ASCENDING)]),
             IndexModel([("createdAt", DESCENDING)]),
@@ -54,6 +68,7 @@ class Database:
         source_indexes = [
             IndexModel([("isActive", ASCENDING)]),
             IndexModel([("lastExtraction", DESCENDING)]),
+            IndexModel([("isActive", ASCENDING), ("lastExtraction", DESCENDING)]),
             IndexModel([("rssUrl", ASCENDING)], unique=True),
         ]
         await self.db.source_configuration.create_indexes(source_indexes)
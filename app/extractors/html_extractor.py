@@ -1,6 +1,7 @@
 """HTML-based content extraction using BeautifulSoup and httpx"""
+import asyncio
 import re
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound
 from typing import Dict, List, Optional
 import logging
 from motor.motor_asyncio import AsyncIOMotorDatabase
@@ -18,6 +19,22 @@ from app.config import settings
 logger = logging.getLogger(__name__)
 
 
+def _make_soup(markup: str) -> BeautifulSoup:
+    """
+    Parse a full page with lxml, falling back to html.parser.
+
+    Args:
+        markup: Raw HTML
+
+    Returns:
+        Parsed BeautifulSoup tree
+    """
+    try:
+        return BeautifulSoup(markup, 'lxml')
+    except FeatureNotFound:
+        return BeautifulSoup(markup, 'html.parser')
+
+
 class HTMLExtractor(BaseExtractor):
     """Extract content from HTML pages
 
@@ -66,7 +83,7 @@ class HTMLExtractor(BaseExtractor):
                 html = response.text
 
             # Parse HTML
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = _make_soup(html)
             article_selector = config.get('articleSelector', 'article')
             articles = soup.select(article_selector)
 
@@ -169,7 +186,7 @@ class HTMLExtractor(BaseExtractor):
         raw_content = excerpt_elem.get_text(strip=True) if excerpt_elem else title
 
         # Extract fact-checkable content
-        content = extract_checkable_content(raw_content, max_chars=500)
+        content = await asyncio.to_thread(extract_checkable_content, raw_content, max_chars=500)
 
         if len(content) < 50:
             logger.debug(f"Content too short after extraction: {url}")
@@ -188,16 +205,18 @@ class HTMLExtractor(BaseExtractor):
         # Generate content hash
         content_hash = generate_content_hash(url, content)
 
-        # Calculate pre-filter score
-        score_breakdown = self.pre_filter.calculate_score(
+        # Calculate pre-filter score (stops early when below minimum save score)
+        score_breakdown, passed = await asyncio.to_thread(
+            self.pre_filter.score_and_filter,
             content=content,
             title=title,
             source_url=url,
-            credibility_level=source['credibilityLevel']
+            credibility_level=source['credibilityLevel'],
+            threshold=settings.minimum_save_score
         )
 
         # Skip low-scoring content
-        if score_breakdown['total'] < settings.minimum_save_score:
+        if not passed:
             logger.debug(
                 f"Content score ({score_breakdown['total']}) below minimum ({settings.minimum_save_score}), "
                 f"skipping: {title[:50]}..."
@@ -253,7 +272,7 @@ class HTMLExtractor(BaseExtractor):
                 article_html = response.text
 
             # Parse article page
-            soup = BeautifulSoup(article_html, 'html.parser')
+            soup = _make_soup(article_html)
 
             # Extract full content body
             content_selector = article_page_config.get('contentSelector', '.w-richtext')
@@ -268,7 +287,7 @@ class HTMLExtractor(BaseExtractor):
 
             # Extract fact-checkable content (allow more chars for full articles)
             max_chars = article_page_config.get('maxChars', 2000)
-            content = extract_checkable_content(raw_content, max_chars=max_chars)
+            content = await asyncio.to_thread(extract_checkable_content, raw_content, max_chars=max_chars)
 
             if len(content) < 100:
                 logger.debug(f"Full article content too short ({len(content)} chars): {url}")
@@ -287,16 +306,18 @@ class HTMLExtractor(BaseExtractor):
             # Generate content hash
             content_hash = generate_content_hash(url, content)
 
-            # Calculate pre-filter score
-            score_breakdown = self.pre_filter.calculate_score(
+            # Calculate pre-filter score (stops early when below minimum save score)
+            score_breakdown, passed = await asyncio.to_thread(
+                self.pre_filter.score_and_filter,
                 content=content,
                 title=title,
                 source_url=url,
-                credibility_level=source['credibilityLevel']
+                credibility_level=source['credibilityLevel'],
+                threshold=settings.minimum_save_score
             )
 
             # Skip low-scoring content
-            if score_breakdown['total'] < settings.minimum_save_score:
+            if not passed:
                 logger.debug(
                     f"Full article score ({score_breakdown['total']}) below minimum ({settings.minimum_save_score}), "
                     f"skipping: {title[:50]}..."
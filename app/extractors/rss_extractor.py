@@ -1,4 +1,5 @@
 """RSS feed extraction logic with sentence-level fact-checkable content extraction"""
+import asyncio
 import feedparser
 from bs4 import BeautifulSoup
 from langdetect import detect, LangDetectException
@@ -48,8 +49,8 @@ class RSSExtractor(BaseExtractor):
         try:
             logger.info(f"Extracting from source: {source['name']}")
 
-            # Fetch RSS feed
-            feed = feedparser.parse(source['rssUrl'])
+            # Fetch RSS feed (blocking network I/O, so keep it off the event loop)
+            feed = await asyncio.to_thread(feedparser.parse, source['rssUrl'])
 
             if feed.bozo:
                 logger.warning(f"RSS feed parsing warning for {source['name']}: {feed.bozo_exception}")
@@ -130,7 +131,7 @@ class RSSExtractor(BaseExtractor):
             return None
 
         # Extract fact-checkable content using sentence-level scoring
-        content = extract_checkable_content(raw_content, max_chars=500)
+        content = await asyncio.to_thread(extract_checkable_content, raw_content, max_chars=500)
 
         # Minimum content length check (after extraction)
         if len(content) < 50:
@@ -149,16 +150,18 @@ class RSSExtractor(BaseExtractor):
         # Generate content hash for deduplication
         content_hash = generate_content_hash(url, content)
 
-        # Calculate pre-filter score
-        score_breakdown = self.pre_filter.calculate_score(
+        # Calculate pre-filter score (stops early when below minimum save score)
+        score_breakdown, passed = await asyncio.to_thread(
+            self.pre_filter.score_and_filter,
             content=content,
             title=title,
             source_url=url,
-            credibility_level=source['credibilityLevel']
+            credibility_level=source['credibilityLevel'],
+            threshold=settings.minimum_save_score
         )
 
         # Skip content with score below minimum threshold
-        if score_breakdown['total'] < settings.minimum_save_score:
+        if not passed:
             logger.debug(
                 f"Content score ({score_breakdown['total']}) below minimum ({settings.minimum_save_score}), "
                 f"skipping: {title[:50]}..."
@@ -244,13 +247,28 @@ async def extract_all_sources(db: AsyncIOMotorDatabase) -> Dict[str, int]:
     # Get all active sources
     sources = await db.source_configuration.find({'isActive': True}).to_list(None)
 
+    # Sources are independent and network-bound, so fetch them concurrently
+    # (capped to avoid flooding the MongoDB pool and remote sites)
+    semaphore = asyncio.Semaphore(settings.extraction_concurrency)
+
+    async def extract_one(source: Dict) -> int:
+        async with semaphore:
+            return await ExtractorFactory.extract_from_source(source, db)
+
+    results = await asyncio.gather(
+        *(extract_one(source) for source in sources),
+        return_exceptions=True
+    )
+
     total_extracted = 0
     source_results = {}
 
-    for source in sources:
-        count = await ExtractorFactory.extract_from_source(source, db)
-        total_extracted += count
-        source_results[source['name']] = count
+    for source, result in zip(sources, results):
+        if isinstance(result, Exception):
+            logger.error(f"Error extracting from source {source['name']}: {result}")
+            result = 0
+        total_extracted += result
+        source_results[source['name']] = result
 
     logger.info(f"Total extraction complete: {total_extracted} articles from {len(sources)} sources")
 
@@ -16,7 +16,7 @@ Thresholds:
 """
 import re
 from urllib.parse import urlparse
-from typing import Dict
+from typing import Dict, Tuple
 import logging
 
 from app.constants import (
@@ -29,6 +29,7 @@ from app.constants import (
     ENTERTAINMENT_KEYWORDS,
     SPORTS_KEYWORDS,
     CONTROVERSY_KEYWORDS,
+    GOVERNMENT_FUNDING_KEYWORDS,
     SPECULATION_KEYWORDS,
     VAGUE_QUANTIFIERS,
     OFFICIAL_GUIDANCE_KEYWORDS,
@@ -42,12 +43,27 @@ from app.constants import (
     LARGE_NUMBER_PATTERN,
     DATE_PATTERN,
     NUMBER_PATTERN,
+    QUOTED_TEXT_PATTERN,
+    PROPER_NOUN_PATTERN,
     SENTENCE_DELIMITER_PATTERN,
     CONDITIONAL_PATTERN
 )
 
 logger = logging.getLogger(__name__)
 
+# Source risk by configured credibility level (inverted: low = highest priority)
+_CREDIBILITY_SCORES = {
+    "low": 10,     # HIGHEST priority - likely misinformation source
+    "medium": 5,
+    "high": 3,
+}
+
+# Entertainment keywords that need word boundaries
+# (can match in 'relator', 'matriz', etc.)
+_WORD_BOUNDARY_ENTERTAINMENT = {
+    kw: re.compile(rf'\b{kw}\b') for kw in ('ator', 'atriz')
+}
+
 
 class PreFilter:
     """Pre-filtering scoring system to prioritize content for fact-checking
@@ -75,46 +91,76 @@ class PreFilter:
         Returns:
             Dictionary with total score and breakdown by category
         """
-        scores = {
-            "content_quality": 0,
-            "fact_checkable": 0,
-            "source_risk": 0,
-            "topic_penalty": 0,
-            "total": 0
-        }
-
-        # Combine title and content for analysis (case-insensitive)
-        full_text = f"{title} {content}".lower()
+        breakdown, _ = PreFilter.score_and_filter(
+            content, title, source_url, credibility_level, threshold=0
+        )
+        return breakdown
 
-        # 1. Content Quality (20 points max)
-        scores["content_quality"] = PreFilter._score_content_quality(content)
+    @staticmethod
+    def score_and_filter(
+        content: str,
+        title: str,
+        source_url: str,
+        credibility_level: str,
+        threshold: int = 35
+    ) -> Tuple[Dict[str, int], bool]:
+        """
+        Calculate pre-filter score, stopping as soon as threshold is unreachable.
+
+        Cheap components (content quality, source risk) are computed first.
+        Keyword/regex scanning only runs if the maximum remaining points
+        (30 fact-checkable, topic penalty never positive) can still reach
+        the threshold, and the topic penalty is skipped once the positive
+        components fall short.
 
-        # 2. Fact-Checkable Indicators (30 points max)
-        scores["fact_checkable"] = PreFilter._score_fact_checkable(full_text)
+        Args:
+            content: Main text content
+            title: Article title
+            source_url: Source URL
+            credibility_level: Source credibility ('high', 'medium', 'low')
+            threshold: Minimum total score required (default: 35)
 
-        # 3. Source Risk (10 points max) - LOW credibility gets HIGHEST score
-        scores["source_risk"] = PreFilter._score_source_risk(source_url, credibility_level)
+        Returns:
+            Tuple of (score breakdown, passed). The breakdown has the same
+            shape as calculate_score; when scoring stops early, components
+            that were not computed are 0 and total is the partial score
+            reached so far.
+        """
+        content_quality = PreFilter._score_content_quality(content)
+        source_risk = PreFilter._score_source_risk(source_url, credibility_level)
+        fact_checkable = 0
+        topic_penalty = 0
+
+        def breakdown(total: int) -> Dict[str, int]:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Score breakdown: total={total}, "
+                    f"quality={content_quality}, "
+                    f"checkable={fact_checkable}, "
+                    f"source={source_risk}, "
+                    f"penalty={topic_penalty}"
+                )
+            return {
+                "content_quality": content_quality,
+                "fact_checkable": fact_checkable,
+                "source_risk": source_risk,
+                "topic_penalty": topic_penalty,
+                "total": total
+            }
+
+        if content_quality + source_risk + 30 < threshold:
+            return breakdown(content_quality + source_risk), False
 
-        # 4. Topic Penalty (-30 to 0 points for entertainment/sports)
-        scores["topic_penalty"] = PreFilter._calculate_topic_penalty(full_text)
+        full_text = f"{title} {content}".lower()
 
-        # Calculate total (clamped to minimum 0)
-        scores["total"] = max(0, sum([
-            scores["content_quality"],
-            scores["fact_checkable"],
-            scores["source_risk"],
-            scores["topic_penalty"]  # Negative value
-        ]))
+        fact_checkable = PreFilter._score_fact_checkable(full_text)
+        if content_quality + fact_checkable + source_risk < threshold:
+            return breakdown(content_quality + fact_checkable + source_risk), False
 
-        logger.debug(
-            f"Score breakdown: total={scores['total']}, "
-            f"quality={scores['content_quality']}, "
-            f"checkable={scores['fact_checkable']}, "
-            f"source={scores['source_risk']}, "
-            f"penalty={scores['topic_penalty']}"
-        )
+        topic_penalty = PreFilter._calculate_topic_penalty(full_text)
+        total = max(0, content_quality + fact_checkable + source_risk + topic_penalty)
 
-        return scores
+        return breakdown(total), total >= threshold
 
     @staticmethod
     def _score_content_quality(content: str) -> int:
@@ -192,44 +238,44 @@ class PreFilter:
         # STEP 1: Base Topic Score (pick highest, not additive)
         base_score = 0
 
+        # Tiers are checked from highest to lowest so the first hit decides
+        # and the remaining keyword sweeps are skipped
         if any(entity in text for entity in GOVERNMENT_ENTITIES):
-            base_score = max(base_score, 12)  # Reduced from 18
-
-        if any(kw in text for kw in POLITICAL_KEYWORDS):
-            base_score = max(base_score, 10)  # Reduced from 15
-
-        if any(kw in text for kw in SOCIAL_RELEVANCE_KEYWORDS):
-            base_score = max(base_score, 8)   # Reduced from 12
-
-        has_health = any(kw in text for kw in HEALTH_KEYWORDS)
-        has_science = any(kw in text for kw in SCIENCE_KEYWORDS)
-        if has_health or has_science:
-            base_score = max(base_score, 8)   # Reduced from 10
+            base_score = 12  # Reduced from 18
+        elif any(kw in text for kw in POLITICAL_KEYWORDS):
+            base_score = 10  # Reduced from 15
+        elif (any(kw in text for kw in SOCIAL_RELEVANCE_KEYWORDS)
+              or any(kw in text for kw in HEALTH_KEYWORDS)
+              or any(kw in text for kw in SCIENCE_KEYWORDS)):
+            base_score = 8   # Social relevance / Health / Science (reduced from 12/10)
 
         score += base_score
 
         # STEP 2: Verifiability Modifiers (additive)
 
         # A. Verifiable Data (HIGHEST PRIORITY - increased weight)
+        # Every data pattern needs a digit (or "$" for currency), so a single
+        # scan rules out the whole cascade for text without numbers
         has_data = False
-        if PERCENTAGE_PATTERN.search(text):
-            score += 10  # Increased from 6 - percentages are highly checkable
-            has_data = True
-        elif CURRENCY_BRL_PATTERN.search(text) or CURRENCY_USD_PATTERN.search(text):
-            score += 10  # Increased from 6 - currency values are specific
-            has_data = True
-        elif LARGE_NUMBER_PATTERN.search(text):
-            score += 8   # Increased from 5
-            has_data = True
-        elif DATE_PATTERN.search(text):
-            score += 6   # Increased from 4
-            has_data = True
-        elif NUMBER_PATTERN.search(text):
-            score += 4   # Increased from 3
+        has_digit = NUMBER_PATTERN.search(text) is not None
+        if has_digit or '$' in text:
             has_data = True
+            if PERCENTAGE_PATTERN.search(text):
+                score += 10  # Increased from 6 - percentages are highly checkable
+            elif CURRENCY_BRL_PATTERN.search(text) or CURRENCY_USD_PATTERN.search(text):
+                score += 10  # Increased from 6 - currency values are specific
+            elif LARGE_NUMBER_PATTERN.search(text):
+                score += 8   # Increased from 5
+            elif DATE_PATTERN.search(text):
+                score += 6   # Increased from 4
+            elif has_digit:
+                score += 4   # Increased from 3
+            else:
+                has_data = False
 
         # B. Direct Quotes (NEW - highly verifiable)
-        if re.search(r'["""]\s*.{20,}\s*["""]', text):
+        # Substring pre-check skips the regex for text without quote marks
+        if '"' in text and QUOTED_TEXT_PATTERN.search(text):
             score += 8
 
         # C. Attribution Keywords (reduced weight)
@@ -239,9 +285,13 @@ class PreFilter:
 
         # D. Specific Named Entities (NEW - capitals indicate proper nouns)
         # Count sequences of capitalized words (names of people/organizations)
-        proper_nouns = re.findall(r'\b[A-ZÇÁÉÍÓÚÂÊÔÃÕ][a-zçáéíóúâêôãõ]+(?:\s+[A-ZÇÁÉÍÓÚÂÊÔÃÕ][a-zçáéíóúâêôãõ]+)+\b', text)
-        if len(proper_nouns) >= 2:  # At least 2 named entities
-            score += 4
+        # Stop at the second match, only the threshold matters
+        proper_nouns = 0
+        for _ in PROPER_NOUN_PATTERN.finditer(text):
+            proper_nouns += 1
+            if proper_nouns >= 2:  # At least 2 named entities
+                score += 4
+                break
 
         # STEP 3: Penalties & Bonuses
 
@@ -258,7 +308,13 @@ class PreFilter:
             score -= speculation_count * 15  # Heavy penalty for speculation
 
         # Conditional/future statements penalty (not fact-checkable)
-        conditional_matches = len(CONDITIONAL_PATTERN.findall(text))
+        # Stop counting at 5: 5 * 12 exceeds the maximum positive score (54),
+        # so further matches cannot change the clamped result
+        conditional_matches = 0
+        for _ in CONDITIONAL_PATTERN.finditer(text):
+            conditional_matches += 1
+            if conditional_matches >= 5:
+                break
         if conditional_matches > 0:
             score -= conditional_matches * 12  # Penalty for conditional futures
 
@@ -314,45 +370,50 @@ class PreFilter:
         penalty = 0
 
         # Entertainment Check
-        # Count how many entertainment keywords appear
+        # Count how many entertainment keywords appear (tiers saturate at 3)
         # Special handling for ambiguous words that need word boundaries
-        ambiguous_celebrity_words = ['ator', 'atriz']  # Can match in 'relator', 'matriz', etc.
-
         entertainment_matches = 0
         for kw in ENTERTAINMENT_KEYWORDS:
-            if kw in ambiguous_celebrity_words:
-                # Use word boundaries for these terms
-                import re
-                if re.search(rf'\b{kw}\b', text):
-                    entertainment_matches += 1
-            else:
-                if kw in text:
+            boundary_pattern = _WORD_BOUNDARY_ENTERTAINMENT.get(kw)
+            if boundary_pattern is not None:
+                if boundary_pattern.search(text):
                     entertainment_matches += 1
-
-        # Check for government money/investment context (overrides entertainment penalty)
-        has_gov_money = any(term in text for term in ['governo', 'ministério', 'federal', 'investiu', 'investimento'])
-        has_currency = CURRENCY_BRL_PATTERN.search(text) is not None
-
-        # Only apply entertainment penalty if NOT government funding context
-        if not (has_gov_money and has_currency and entertainment_matches <= 2):
+            elif kw in text:
+                entertainment_matches += 1
             if entertainment_matches >= 3:
-                penalty -= 35  # Heavy entertainment (reality TV, celebrity, gossip)
-            elif entertainment_matches >= 2:
-                penalty -= 30  # Medium entertainment
-            elif entertainment_matches >= 1:
-                penalty -= 25  # Light entertainment
-
-        # Sports Check (with controversy override)
-        sports_matches = sum(1 for kw in SPORTS_KEYWORDS if kw in text)
-
-        # Check if sports content involves corruption/scandal (then it's checkable)
-        has_controversy = any(kw in text for kw in CONTROVERSY_KEYWORDS)
-
-        # Only penalize pure sports (match results, scores)
-        if not has_controversy:
+                break
+
+        if entertainment_matches:
+            # Government money/investment context overrides light/medium
+            # entertainment penalty (only checked when it can apply)
+            is_gov_funding = (
+                entertainment_matches <= 2
+                and any(term in text for term in GOVERNMENT_FUNDING_KEYWORDS)
+                and CURRENCY_BRL_PATTERN.search(text) is not None
+            )
+
+            if not is_gov_funding:
+                if entertainment_matches >= 3:
+                    penalty -= 35  # Heavy entertainment (reality TV, celebrity, gossip)
+                elif entertainment_matches >= 2:
+                    penalty -= 30  # Medium entertainment
+                else:
+                    penalty -= 25  # Light entertainment
+
+        # Sports Check (with controversy override, tiers saturate at 3)
+        sports_matches = 0
+        for kw in SPORTS_KEYWORDS:
+            if kw in text:
+                sports_matches += 1
+                if sports_matches >= 3:
+                    break
+
+        # Only penalize pure sports (match results, scores); sports content
+        # involving corruption/scandal is checkable
+        if sports_matches >= 2 and not any(kw in text for kw in CONTROVERSY_KEYWORDS):
             if sports_matches >= 3:
                 penalty -= 25  # Heavy sports content
-            elif sports_matches >= 2:
+            else:
                 penalty -= 15  # Medium sports content
 
         # Cap maximum penalty at -40 (increased from -30)
@@ -394,17 +455,10 @@ class PreFilter:
         elif domain in MEDIUM_CREDIBILITY_SOURCES:
             return 5
 
-        # Fall back to configured credibility level
-        if credibility_level == "low":
-            return 10  # HIGHEST priority - likely misinformation source
-        elif credibility_level == "medium":
-            return 5
-        elif credibility_level == "high":
-            return 3
-        else:
-            # Unknown/unconfigured sources treated as low credibility
-            # Better to over-monitor than under-monitor
-            return 10
+        # Fall back to configured credibility level.
+        # Unknown/unconfigured sources treated as low credibility:
+        # better to over-monitor than under-monitor
+        return _CREDIBILITY_SCORES.get(credibility_level, 10)
 
     @staticmethod
     def should_submit(score: int, threshold: int = 35) -> bool:
@@ -1,14 +1,19 @@
 """FastAPI application entry point"""
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+from langdetect.detector_factory import init_factory
+import asyncio
 import logging
 
 from app.config import settings
 from app.database import database
 from app.scheduler import setup_scheduler, start_scheduler, shutdown_scheduler
 from app.routes import sources, content, stats, aletheia
+from app.services.ory_auth import ory_auth
+from app.clients.aletheia_client import close_http_client
 
 # Configure logging
 logging.basicConfig(
@@ -28,6 +33,10 @@ async def lifespan(app: FastAPI):
     # Connect to database
     await database.connect()
 
+    # Load language detection profiles up front (~300ms, otherwise paid
+    # lazily by the first extraction run)
+    await asyncio.to_thread(init_factory)
+
     # Setup and start scheduler
     setup_scheduler()
     start_scheduler()
@@ -39,8 +48,12 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down application...")
 
-    # Stop scheduler
-    shutdown_scheduler()
+    # Stop scheduler (and any in-flight automatic submission)
+    await shutdown_scheduler()
+
+    # Close pooled HTTP connections
+    await ory_auth.aclose()
+    await close_http_client()
 
     # Disconnect from database
     await database.disconnect()
@@ -53,7 +66,8 @@ app = FastAPI(
     title="Disinformation Monitoring POC",
     description="Automated extraction and submission of news content to AletheiaFact",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
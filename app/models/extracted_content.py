@@ -31,6 +31,7 @@ class ExtractedContent(BaseModel):
     verificationRequestId: Optional[str] = Field(None, description="VR ID from AletheiaFact")
     submittedToAletheiaAt: Optional[datetime] = Field(None, description="Timestamp of submission")
     submissionError: Optional[str] = Field(None, description="Error message if submission failed")
+    submissionClaimedAt: Optional[datetime] = Field(None, description="Set while a worker is submitting this item")
 
     createdAt: datetime = Field(default_factory=datetime.utcnow)
     updatedAt: datetime = Field(default_factory=datetime.utcnow)
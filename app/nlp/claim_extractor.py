@@ -10,21 +10,29 @@ Philosophy: Regex + Smart Patterns > Heavy ML Models
 - <2ms per article extraction time
 - Zero external dependencies (no spaCy, no BERT)
 """
-import re
+import heapq
+from functools import lru_cache
 from typing import List, Dict
 from bs4 import BeautifulSoup
 import logging
 
 from app.constants import (
-    NOISE_PATTERNS,
+    SENTENCE_NOISE_PHRASES,
+    OPINION_PATTERNS,
+    LEADING_PRONOUN_PATTERN,
+    SENTENCE_BOUNDARY_PATTERN,
+    PARAGRAPH_BREAK_PATTERN,
     VAGUE_KEYWORDS,
-    GOVERNMENT_ENTITIES,
+    GOVERNMENT_ENTITY_PATTERN,
     PERCENTAGE_PATTERN,
     CURRENCY_BRL_PATTERN,
     CURRENCY_USD_PATTERN,
     LARGE_NUMBER_PATTERN,
     DATE_PATTERN,
     NUMBER_PATTERN,
+    ENTITY_VERB_QUE_VERBS,
+    ENTITY_VERB_COLON_VERBS,
+    ENTITY_ACTION_VERBS,
     PATTERN_ENTITY_VERB_QUE,
     PATTERN_SEGUNDO,
     PATTERN_DE_ACORDO_COM,
@@ -38,6 +46,122 @@ from app.constants import (
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _score_sentence(sentence: str) -> int:
+    """
+    Cached implementation of SentenceScorer.score_sentence.
+
+    Scoring is a pure function of the sentence text, and boilerplate
+    sentences (headlines, promos, signatures) repeat across articles.
+    """
+    score = 0
+    # Every pattern below is case-insensitive (or caseless), so all of
+    # them scan the same lowercased string
+    sent_lower = sentence.lower()
+    sent_len = len(sentence)
+
+    # Check for hard noise (disqualify immediately)
+    if any(phrase in sent_lower for phrase in SENTENCE_NOISE_PHRASES):
+        return -100  # Instant disqualification
+
+    # A1. Direct quotes (HIGHEST PRIORITY - directly verifiable)
+    has_quote = PATTERN_DIRECT_QUOTE.search(sent_lower)
+    if has_quote:
+        score += 40
+
+    # A2. Attribution patterns with data (second highest)
+    # The entity patterns are by far the most expensive checks here, so
+    # each one only runs if one of its verbs (or the colon) is present
+    has_attribution = False
+    if (any(verb in sent_lower for verb in ENTITY_VERB_QUE_VERBS)
+            and PATTERN_ENTITY_VERB_QUE.search(sent_lower)):
+        score += 30  # Strong attribution: "X afirmou que Y"
+        has_attribution = True
+    elif PATTERN_SEGUNDO.search(sent_lower) or PATTERN_DE_ACORDO_COM.search(sent_lower):
+        score += 25  # Reverse attribution: "Segundo X, Y"
+        has_attribution = True
+    elif PATTERN_CONFORME.search(sent_lower):
+        score += 20  # Weaker attribution: "Conforme X, Y"
+        has_attribution = True
+    elif (':' in sent_lower
+            and any(verb in sent_lower for verb in ENTITY_VERB_COLON_VERBS)
+            and PATTERN_ENTITY_VERB_COLON.search(sent_lower)):
+        score += 25  # Colon attribution: "X garante: Y"
+        has_attribution = True
+    elif (any(verb in sent_lower for verb in ENTITY_ACTION_VERBS)
+            and PATTERN_ENTITY_ACTION.search(sent_lower)):
+        score += 20  # Action statement: "X anuncia Y"
+        has_attribution = True
+
+    # B. Verifiable data (critical for checkability)
+    # Every data pattern needs a digit except the currency ones, which can
+    # match on "R$" alone, so one digit scan rules out the whole cascade
+    has_data = False
+    data_score = 0
+    has_digit = NUMBER_PATTERN.search(sent_lower) is not None
+    if has_digit or '$' in sent_lower:
+        if PERCENTAGE_PATTERN.search(sent_lower):
+            data_score = 20  # Percentage = highly specific
+            has_data = True
+        elif CURRENCY_BRL_PATTERN.search(sent_lower) or CURRENCY_USD_PATTERN.search(sent_lower):
+            data_score = 20  # Currency values
+            has_data = True
+        elif LARGE_NUMBER_PATTERN.search(sent_lower):
+            data_score = 15  # Large numbers (milhões, bilhões)
+            has_data = True
+        elif DATE_PATTERN.search(sent_lower):
+            data_score = 10  # Specific dates
+            has_data = True
+        elif has_digit:
+            data_score = 8   # Any number
+            has_data = True
+
+    # Bonus: Data + attribution = highly checkable
+    if has_attribution and has_data:
+        score += 15  # Bonus for combining attribution with data
+
+    score += data_score
+
+    # C. Verifiable affirmations (data-driven statements without attribution)
+    # Example: "A inflação atingiu 10%" or "Desemprego caiu para 8%"
+    if has_data and PATTERN_DATA_AFFIRMATION.search(sent_lower):
+        score += 15  # Affirmation with verifiable data
+
+    # D. Government entities (high-priority sources)
+    has_gov_entity = GOVERNMENT_ENTITY_PATTERN.search(sent_lower) is not None
+    if has_gov_entity:
+        score += 10
+        # Bonus if government entity + data
+        if has_data:
+            score += 5
+
+    # E. Vague language penalty (increased)
+    vague_count = sum(1 for term in VAGUE_KEYWORDS if term in sent_lower)
+    score -= vague_count * 15  # -15 per vague term (increased from -10)
+
+    # F. Opinion/subjective markers (increased penalty)
+    for pattern in OPINION_PATTERNS:
+        if pattern.search(sent_lower):
+            score -= 20  # Increased from -15
+            break
+
+    # G. Length optimization (prefer 50-150 chars for concise claims)
+    if 50 <= sent_len <= 150:
+        score += 5
+    elif sent_len < 30:
+        score -= 15  # Too short = likely fragment (increased penalty)
+    elif sent_len > 200:
+        score -= 10  # Too long = may contain noise (increased penalty)
+
+    # H. Context requirement: penalize if no subject/context
+    # Sentences starting with pronouns without clear antecedent
+    # Longest prefix that can match is "aquilo" + whitespace (7 chars)
+    if LEADING_PRONOUN_PATTERN.match(sent_lower, 0, 7):
+        score -= 10  # Lacks clear subject
+
+    return score
+
+
 class SentenceScorer:
     """Score individual sentences for fact-checkability"""
 
@@ -62,105 +186,12 @@ class SentenceScorer:
         Returns:
             Score (-100 to +100), higher = more fact-checkable
         """
-        score = 0
-        sent_lower = sentence.lower()
-
-        # Check for hard noise (disqualify immediately)
-        for pattern in NOISE_PATTERNS:
-            if pattern.search(sent_lower):
-                return -100  # Instant disqualification
-
-        # A1. Direct quotes (HIGHEST PRIORITY - directly verifiable)
-        has_quote = PATTERN_DIRECT_QUOTE.search(sentence)
-        if has_quote:
-            score += 40
-
-        # A2. Attribution patterns with data (second highest)
-        has_attribution = False
-        if PATTERN_ENTITY_VERB_QUE.search(sentence):
-            score += 30  # Strong attribution: "X afirmou que Y"
-            has_attribution = True
-        elif PATTERN_SEGUNDO.search(sent_lower) or PATTERN_DE_ACORDO_COM.search(sent_lower):
-            score += 25  # Reverse attribution: "Segundo X, Y"
-            has_attribution = True
-        elif PATTERN_CONFORME.search(sent_lower):
-            score += 20  # Weaker attribution: "Conforme X, Y"
-            has_attribution = True
-        elif PATTERN_ENTITY_VERB_COLON.search(sentence):
-            score += 25  # Colon attribution: "X garante: Y"
-            has_attribution = True
-        elif PATTERN_ENTITY_ACTION.search(sentence):
-            score += 20  # Action statement: "X anuncia Y"
-            has_attribution = True
-
-        # B. Verifiable data (critical for checkability)
-        has_data = False
-        data_score = 0
-        if PERCENTAGE_PATTERN.search(sentence):
-            data_score = 20  # Percentage = highly specific
-            has_data = True
-        elif CURRENCY_BRL_PATTERN.search(sent_lower) or CURRENCY_USD_PATTERN.search(sent_lower):
-            data_score = 20  # Currency values
-            has_data = True
-        elif LARGE_NUMBER_PATTERN.search(sent_lower):
-            data_score = 15  # Large numbers (milhões, bilhões)
-            has_data = True
-        elif DATE_PATTERN.search(sent_lower):
-            data_score = 10  # Specific dates
-            has_data = True
-        elif NUMBER_PATTERN.search(sentence):
-            data_score = 8   # Any number
-            has_data = True
+        return _score_sentence(sentence)
 
-        # Bonus: Data + attribution = highly checkable
-        if has_attribution and has_data:
-            score += 15  # Bonus for combining attribution with data
-
-        score += data_score
-
-        # C. Verifiable affirmations (data-driven statements without attribution)
-        # Example: "A inflação atingiu 10%" or "Desemprego caiu para 8%"
-        if has_data and PATTERN_DATA_AFFIRMATION.search(sent_lower):
-            score += 15  # Affirmation with verifiable data
-
-        # D. Government entities (high-priority sources)
-        has_gov_entity = any(entity in sent_lower for entity in GOVERNMENT_ENTITIES)
-        if has_gov_entity:
-            score += 10
-            # Bonus if government entity + data
-            if has_data:
-                score += 5
-
-        # E. Vague language penalty (increased)
-        vague_count = sum(1 for term in VAGUE_KEYWORDS if term in sent_lower)
-        score -= vague_count * 15  # -15 per vague term (increased from -10)
-
-        # F. Opinion/subjective markers (increased penalty)
-        opinion_patterns = [
-            r'(acredito|acho|penso|imagino) que',
-            r'na minha (opinião|visão)',
-            r'(bonito|feio|lindo|horrível|incrível|maravilhoso|emocionante)',
-        ]
-        for pattern in opinion_patterns:
-            if re.search(pattern, sent_lower):
-                score -= 20  # Increased from -15
-                break
-
-        # G. Length optimization (prefer 50-150 chars for concise claims)
-        sent_len = len(sentence)
-        if 50 <= sent_len <= 150:
-            score += 5
-        elif sent_len < 30:
-            score -= 15  # Too short = likely fragment (increased penalty)
-        elif sent_len > 200:
-            score -= 10  # Too long = may contain noise (increased penalty)
-
-        # H. Context requirement: penalize if no subject/context
-        # Sentences starting with pronouns without clear antecedent
-        if re.match(r'^(ele|ela|eles|elas|isso|isto|aquilo)\s', sent_lower):
-            score -= 10  # Lacks clear subject
-
-        return score
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all memoized sentence scores (e.g. after changing patterns)"""
+        _score_sentence.cache_clear()
 
 
 class ClaimExtractor:
@@ -200,15 +231,19 @@ class ClaimExtractor:
         Returns:
             Clean text from a single coherent block with fact-checkable content
         """
-        # Parse HTML
-        soup = BeautifulSoup(html_content, 'html.parser')
+        if '<' not in html_content and '&' not in html_content:
+            # Plain text (no tags or entities to decode): skip HTML parsing
+            blocks = self._split_text_blocks(html_content.strip())
+        else:
+            # Parse HTML
+            soup = BeautifulSoup(html_content, 'html.parser')
 
-        # Remove noise elements
-        for element in soup(['script', 'style', 'iframe', 'noscript', 'nav', 'header', 'footer']):
-            element.decompose()
+            # Remove noise elements
+            for element in soup(['script', 'style', 'iframe', 'noscript', 'nav', 'header', 'footer']):
+                element.decompose()
 
-        # Extract paragraph blocks (preserve structure)
-        blocks = self._extract_paragraph_blocks(soup)
+            # Extract paragraph blocks (preserve structure)
+            blocks = self._extract_paragraph_blocks(soup)
 
         if not blocks:
             logger.debug("No content blocks found")
@@ -234,8 +269,7 @@ class ClaimExtractor:
                 continue
 
             # Block scoring: 70% top sentence + 30% average of all positive sentences
-            sentence_scores.sort(reverse=True, key=lambda x: x[0])
-            top_score = sentence_scores[0][0]
+            top_score = max(s[0] for s in sentence_scores)
             avg_score = sum(s[0] for s in sentence_scores) / len(sentence_scores)
             block_score = (top_score * 0.7) + (avg_score * 0.3)
 
@@ -252,15 +286,13 @@ class ClaimExtractor:
             logger.debug("No fact-checkable blocks found")
             return ""
 
-        # Sort blocks by score (highest first)
-        scored_blocks.sort(reverse=True, key=lambda x: x[0])
-
-        # Select the best block
-        best_score, best_block, best_sentences = scored_blocks[0]
+        # Select the best block (first one wins on ties)
+        best_score, best_block, best_sentences = max(scored_blocks, key=lambda x: x[0])
 
         # Return the COMPLETE best block (trimmed to max_chars if needed)
         # DO NOT join sentences - return the block AS-IS to preserve context
-        result = best_block.strip()
+        # (blocks are already whitespace-normalized, so no strip needed)
+        result = best_block
 
         # If block exceeds max_chars, truncate intelligently at sentence boundary
         if len(result) > max_chars:
@@ -297,9 +329,12 @@ class ClaimExtractor:
             soup: BeautifulSoup parsed HTML
 
         Returns:
-            List of paragraph text blocks
+            List of unique paragraph text blocks
         """
         blocks = []
+        # Repeated blocks (promos, related links) would score identically and
+        # can never beat their first occurrence, so keep only the first
+        seen = set()
 
         # Try to find paragraph elements
         paragraph_tags = soup.find_all(['p', 'div'])
@@ -313,22 +348,38 @@ class ClaimExtractor:
             text = ' '.join(text.split())  # Normalize whitespace
 
             # Only keep substantial paragraphs (at least 100 chars)
-            if len(text) >= 100:
+            if len(text) >= 100 and text not in seen:
+                seen.add(text)
                 blocks.append(text)
 
         # Fallback: if no paragraph tags found, split by double newlines
         if not blocks:
-            full_text = soup.get_text(separator='\n', strip=True)
-            potential_blocks = re.split(r'\n\s*\n', full_text)
-
-            for block in potential_blocks:
-                block = ' '.join(block.split())
-                if len(block) >= 100:
-                    blocks.append(block)
+            return self._split_text_blocks(soup.get_text(separator='\n', strip=True))
 
         logger.debug(f"Extracted {len(blocks)} paragraph blocks from HTML")
         return blocks
 
+    def _split_text_blocks(self, text: str) -> List[str]:
+        """
+        Split plain text into paragraph blocks on blank lines.
+
+        Args:
+            text: Plain text content
+
+        Returns:
+            List of unique whitespace-normalized blocks (at least 100 chars each)
+        """
+        blocks = []
+        seen = set()
+        for block in PARAGRAPH_BREAK_PATTERN.split(text):
+            block = ' '.join(block.split())
+            if len(block) >= 100 and block not in seen:
+                seen.add(block)
+                blocks.append(block)
+
+        logger.debug(f"Extracted {len(blocks)} paragraph blocks from text")
+        return blocks
+
     def _split_sentences(self, text: str) -> List[str]:
         """
         Split text into sentences intelligently.
@@ -341,23 +392,13 @@ class ClaimExtractor:
         Returns:
             List of sentences
         """
-        # Handle common abbreviations that shouldn't split
-        text = re.sub(r'\b(Dr|Sr|Sra|Prof|Gov)\.\s+', r'\1<DOT> ', text)
-
-        # Split on sentence boundaries
-        raw_sentences = re.split(r'[.!?]+', text)
-
+        # Split on sentence boundaries (abbreviations like "Dr. " don't split),
+        # skipping fragments shorter than 30 chars
         sentences = []
-        for sent in raw_sentences:
-            # Restore abbreviations
-            sent = sent.replace('<DOT>', '.')
+        for sent in SENTENCE_BOUNDARY_PATTERN.split(text):
             sent = sent.strip()
-
-            # Skip if too short
-            if len(sent) < 30:
-                continue
-
-            sentences.append(sent)
+            if len(sent) >= 30:
+                sentences.append(sent)
 
         return sentences
 
@@ -375,17 +416,22 @@ class ClaimExtractor:
         """
         claims = []
 
-        # Try each pattern
+        # Try each pattern, skipping the full-text scan when none of the
+        # words the pattern requires occurs in the text
+        text_lower = text.lower()
         patterns = [
-            (PATTERN_ENTITY_VERB_QUE, 3),        # (speaker, verb, claim)
-            (PATTERN_SEGUNDO, 2),                 # (speaker, claim)
-            (PATTERN_DE_ACORDO_COM, 2),           # (speaker, claim)
-            (PATTERN_CONFORME, 2),                # (speaker, claim)
-            (PATTERN_ENTITY_VERB_COLON, 3),      # (speaker, verb, claim)
-            (PATTERN_ENTITY_ACTION, 3),          # (speaker, action, claim)
+            (PATTERN_ENTITY_VERB_QUE, 3, ENTITY_VERB_QUE_VERBS),     # (speaker, verb, claim)
+            (PATTERN_SEGUNDO, 2, ('segundo',)),                      # (speaker, claim)
+            (PATTERN_DE_ACORDO_COM, 2, ('de acordo com',)),          # (speaker, claim)
+            (PATTERN_CONFORME, 2, ('conforme',)),                    # (speaker, claim)
+            (PATTERN_ENTITY_VERB_COLON, 3, ENTITY_VERB_COLON_VERBS), # (speaker, verb, claim)
+            (PATTERN_ENTITY_ACTION, 3, ENTITY_ACTION_VERBS),         # (speaker, action, claim)
         ]
 
-        for pattern, num_groups in patterns:
+        for pattern, num_groups, required_words in patterns:
+            if not any(word in text_lower for word in required_words):
+                continue
+
             for match in pattern.finditer(text):
                 groups = match.groups()
 
@@ -409,14 +455,23 @@ class ClaimExtractor:
                     'speaker': speaker,
                     'verb': verb,
                     'claim': claim_text,
-                    'has_government_entity': any(entity in speaker.lower() for entity in GOVERNMENT_ENTITIES),
-                    'has_data': bool(PERCENTAGE_PATTERN.search(claim_text) or CURRENCY_BRL_PATTERN.search(claim_text))
+                    'has_government_entity': GOVERNMENT_ENTITY_PATTERN.search(speaker.lower()) is not None,
+                    # Both data patterns need a literal '%' or '$', so check those first
+                    'has_data': (
+                        ('%' in claim_text and PERCENTAGE_PATTERN.search(claim_text) is not None)
+                        or ('$' in claim_text and CURRENCY_BRL_PATTERN.search(claim_text.lower()) is not None)
+                    )
                 })
 
         logger.debug(f"Extracted {len(claims)} claims with attribution")
         return claims
 
 
+# Shared instance for the convenience functions (ClaimExtractor holds no
+# mutable state, so it is safe to reuse across calls and threads)
+_DEFAULT_EXTRACTOR = ClaimExtractor()
+
+
 def extract_checkable_content(html: str, max_chars: int = 500) -> str:
     """
     Convenience function to extract fact-checkable content from HTML.
@@ -428,8 +483,7 @@ def extract_checkable_content(html: str, max_chars: int = 500) -> str:
     Returns:
         Clean text with fact-checkable claims
     """
-    extractor = ClaimExtractor()
-    return extractor.extract_from_html(html, max_chars)
+    return _DEFAULT_EXTRACTOR.extract_from_html(html, max_chars)
 
 
 def extract_best_claims(text: str, max_claims: int = 3) -> List[Dict]:
@@ -443,13 +497,12 @@ def extract_best_claims(text: str, max_claims: int = 3) -> List[Dict]:
     Returns:
         List of top claims with speaker and claim text
     """
-    extractor = ClaimExtractor()
-    all_claims = extractor.extract_claims_with_attribution(text)
-
-    # Sort by government entity first, then by data presence
-    all_claims.sort(
-        key=lambda c: (c['has_government_entity'], c['has_data']),
-        reverse=True
+    all_claims = _DEFAULT_EXTRACTOR.extract_claims_with_attribution(text)
+
+    # Top claims by government entity first, then by data presence
+    # (stable: ties keep extraction order, same as a full sort)
+    return heapq.nlargest(
+        max_claims,
+        all_claims,
+        key=lambda c: (c['has_government_entity'], c['has_data'])
     )
-
-    return all_claims[:max_claims]
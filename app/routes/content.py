@@ -47,7 +47,11 @@ async def list_content(
         for content in content_list:
             content['_id'] = str(content['_id'])
 
-        total = await db.extracted_content.count_documents(query)
+        # Unfiltered totals come from collection metadata instead of a scan
+        if query:
+            total = await db.extracted_content.count_documents(query)
+        else:
+            total = await db.extracted_content.estimated_document_count()
 
         return {
             'content': content_list,
@@ -4,6 +4,8 @@ from typing import List, Optional
 from datetime import datetime
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
 from app.database import get_database
 from app.models.source import SourceConfiguration, CredibilityLevel
@@ -46,7 +48,11 @@ async def list_sources(
         for source in sources:
             source['_id'] = str(source['_id'])
 
-        total = await db.source_configuration.count_documents(query)
+        # Unfiltered totals come from collection metadata instead of a scan
+        if query:
+            total = await db.source_configuration.count_documents(query)
+        else:
+            total = await db.source_configuration.estimated_document_count()
 
         return {
             'sources': sources,
@@ -67,16 +73,15 @@ async def create_source(
 ):
     """Create a new RSS source"""
     try:
-        # Check if source with same URL already exists
-        existing = await db.source_configuration.find_one({'rssUrl': source.rssUrl})
-        if existing:
-            raise HTTPException(status_code=400, detail="Source with this RSS URL already exists")
-
         source_dict = source.model_dump()
         source_dict['createdAt'] = datetime.utcnow()
         source_dict['updatedAt'] = datetime.utcnow()
 
-        result = await db.source_configuration.insert_one(source_dict)
+        # The unique index on rssUrl rejects duplicates without a lookup first
+        try:
+            result = await db.source_configuration.insert_one(source_dict)
+        except DuplicateKeyError:
+            raise HTTPException(status_code=400, detail="Source with this RSS URL already exists")
 
         source_dict['_id'] = str(result.inserted_id)
 
@@ -120,26 +125,20 @@ async def update_source(
 ):
     """Update a source configuration"""
     try:
-        # Check if source exists
-        existing = await db.source_configuration.find_one({'_id': ObjectId(source_id)})
-        if not existing:
-            raise HTTPException(status_code=404, detail="Source not found")
-
         # Prepare update data
         update_data = {k: v for k, v in updates.items() if v is not None}
         update_data['updatedAt'] = datetime.utcnow()
 
-        # Update source
-        result = await db.source_configuration.update_one(
+        # Update and return the new document in a single round-trip
+        updated_source = await db.source_configuration.find_one_and_update(
             {'_id': ObjectId(source_id)},
-            {'$set': update_data}
+            {'$set': update_data},
+            return_document=ReturnDocument.AFTER
         )
 
-        if result.modified_count == 0:
-            raise HTTPException(status_code=400, detail="No changes made")
+        if not updated_source:
+            raise HTTPException(status_code=404, detail="Source not found")
 
-        # Return updated source
-        updated_source = await db.source_configuration.find_one({'_id': ObjectId(source_id)})
         updated_source['_id'] = str(updated_source['_id'])
 
         logger.info(f"Updated source: {source_id}")
@@ -1,115 +1,172 @@
 """Statistics API endpoints"""
+import asyncio
+import time
 from fastapi import APIRouter, HTTPException, Depends
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from typing import Dict
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
+from app.config import settings
 from app.database import get_database
 import logging
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/stats", tags=["statistics"])
 
+# Dashboards poll this endpoint, so the payload is shared for a short TTL
+_stats_cache = {'value': None, 'expires_at': 0.0}
+_stats_lock = asyncio.Lock()
 
-@router.get("")
-async def get_statistics(
-    db: AsyncIOMotorDatabase = Depends(get_database)
-):
-    """Get dashboard statistics"""
-    try:
-        # Calculate today's date range
-        today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        today_end = today_start + timedelta(days=1)
 
-        # Extraction statistics
-        total_today = await db.extracted_content.count_documents({
-            'extractedAt': {'$gte': today_start, '$lt': today_end}
-        })
-
-        # Count by status
-        status_counts = {}
-        for status in ['pending', 'submitted', 'rejected', 'failed']:
-            count = await db.extracted_content.count_documents({'status': status})
-            status_counts[status] = count
-
-        # Average score
-        pipeline = [
-            {'$group': {
-                '_id': None,
-                'avgScore': {'$avg': '$preFilterScore'}
-            }}
-        ]
-        avg_result = await db.extracted_content.aggregate(pipeline).to_list(1)
-        average_score = avg_result[0]['avgScore'] if avg_result else 0.0
-
-        # By source statistics
-        source_pipeline = [
-            {'$group': {
-                '_id': '$sourceName',
-                'count': {'$sum': 1},
-                'submitted': {
-                    '$sum': {
-                        '$cond': [{'$eq': ['$status', 'submitted']}, 1, 0]
-                    }
+async def _compute_statistics(db: AsyncIOMotorDatabase) -> Dict:
+    """
+    Run the dashboard queries and build the statistics payload.
+
+    Args:
+        db: MongoDB database instance
+
+    Returns:
+        Statistics dictionary served by GET /api/stats
+    """
+    # Calculate today's date range
+    today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    today_end = today_start + timedelta(days=1)
+
+    # Average score
+    pipeline = [
+        {'$group': {
+            '_id': None,
+            'avgScore': {'$avg': '$preFilterScore'}
+        }}
+    ]
+
+    # Count by status (one grouped pass instead of a count per status)
+    status_pipeline = [
+        {'$group': {
+            '_id': '$status',
+            'count': {'$sum': 1}
+        }}
+    ]
+
+    # By source statistics
+    source_pipeline = [
+        {'$group': {
+            '_id': '$sourceName',
+            'count': {'$sum': 1},
+            'submitted': {
+                '$sum': {
+                    '$cond': [{'$eq': ['$status', 'submitted']}, 1, 0]
                 }
-            }},
-            {'$sort': {'count': -1}},
-            {'$limit': 10}
-        ]
-        by_source = await db.extracted_content.aggregate(source_pipeline).to_list(10)
-        by_source_formatted = [
-            {
-                'name': item['_id'],
-                'count': item['count'],
-                'submitted': item['submitted']
             }
-            for item in by_source
-        ]
-
-        # Submission statistics
-        total_submitted = status_counts.get('submitted', 0)
-        total_attempts = total_submitted + status_counts.get('failed', 0)
-        success_rate = (total_submitted / total_attempts * 100) if total_attempts > 0 else 0.0
+        }},
+        {'$sort': {'count': -1}},
+        {'$limit': 10}
+    ]
 
+    # The queries are independent, so run them concurrently
+    (
+        total_today,
+        status_result,
+        avg_result,
+        by_source,
+        last_submission,
+        active_sources,
+        sources_list,
+    ) = await asyncio.gather(
+        # Extraction statistics
+        db.extracted_content.count_documents({
+            'extractedAt': {'$gte': today_start, '$lt': today_end}
+        }),
+        db.extracted_content.aggregate(status_pipeline).to_list(None),
+        db.extracted_content.aggregate(pipeline).to_list(1),
+        db.extracted_content.aggregate(source_pipeline).to_list(10),
         # Last submission
-        last_submission = await db.extracted_content.find_one(
+        db.extracted_content.find_one(
             {'status': 'submitted'},
+            {'_id': 0, 'submittedToAletheiaAt': 1},
             sort=[('submittedToAletheiaAt', -1)]
-        )
-        last_submission_time = last_submission['submittedToAletheiaAt'] if last_submission else None
-
+        ),
         # Source statistics
-        active_sources = await db.source_configuration.count_documents({'isActive': True})
-
-        sources_list = await db.source_configuration.find(
+        db.source_configuration.count_documents({'isActive': True}),
+        db.source_configuration.find(
             {'isActive': True},
-            {'name': 1, 'lastExtraction': 1}
-        ).sort('lastExtraction', -1).limit(10).to_list(10)
+            {'_id': 0, 'name': 1, 'lastExtraction': 1}
+        ).sort('lastExtraction', -1).limit(10).to_list(10),
+    )
 
-        last_extraction_times = [
-            {
-                'name': source['name'],
-                'lastExtraction': source.get('lastExtraction')
-            }
-            for source in sources_list
-        ]
-
-        return {
-            'extraction': {
-                'totalToday': total_today,
-                'totalByStatus': status_counts,
-                'averageScore': round(average_score, 2),
-                'bySource': by_source_formatted
-            },
-            'submission': {
-                'totalSubmitted': total_submitted,
-                'successRate': round(success_rate, 2),
-                'lastSubmission': last_submission_time
-            },
-            'sources': {
-                'active': active_sources,
-                'lastExtractionTimes': last_extraction_times
-            }
+    counts = {item['_id']: item['count'] for item in status_result}
+    status_counts = {
+        status: counts.get(status, 0)
+        for status in ['pending', 'submitted', 'rejected', 'failed']
+    }
+
+    average_score = avg_result[0]['avgScore'] if avg_result else 0.0
+
+    by_source_formatted = [
+        {
+            'name': item['_id'],
+            'count': item['count'],
+            'submitted': item['submitted']
         }
+        for item in by_source
+    ]
+
+    # Submission statistics
+    total_submitted = status_counts.get('submitted', 0)
+    total_attempts = total_submitted + status_counts.get('failed', 0)
+    success_rate = (total_submitted / total_attempts * 100) if total_attempts > 0 else 0.0
+
+    last_submission_time = last_submission['submittedToAletheiaAt'] if last_submission else None
+
+    last_extraction_times = [
+        {
+            'name': source['name'],
+            'lastExtraction': source.get('lastExtraction')
+        }
+        for source in sources_list
+    ]
+
+    return {
+        'extraction': {
+            'totalToday': total_today,
+            'totalByStatus': status_counts,
+            'averageScore': round(average_score, 2),
+            'bySource': by_source_formatted
+        },
+        'submission': {
+            'totalSubmitted': total_submitted,
+            'successRate': round(success_rate, 2),
+            'lastSubmission': last_submission_time
+        },
+        'sources': {
+            'active': active_sources,
+            'lastExtractionTimes': last_extraction_times
+        }
+    }
+
+
+@router.get("")
+async def get_statistics(
+    db: AsyncIOMotorDatabase = Depends(get_database)
+):
+    """Get dashboard statistics (cached for STATS_CACHE_TTL_SECONDS)"""
+    try:
+        # Caching disabled: compute per request, without serializing on the lock
+        if settings.stats_cache_ttl_seconds <= 0:
+            return await _compute_statistics(db)
+
+        if time.monotonic() < _stats_cache['expires_at']:
+            return _stats_cache['value']
+
+        # Only one request recomputes on expiry; the others wait and reuse it
+        async with _stats_lock:
+            if time.monotonic() < _stats_cache['expires_at']:
+                return _stats_cache['value']
+
+            stats = await _compute_statistics(db)
+            _stats_cache['value'] = stats
+            _stats_cache['expires_at'] = time.monotonic() + settings.stats_cache_ttl_seconds
+            return stats
 
     except Exception as e:
         logger.error(f"Error getting statistics: {e}")
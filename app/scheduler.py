@@ -2,6 +2,9 @@
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from datetime import datetime
+from typing import Optional
+import asyncio
+import contextlib
 import logging
 
 from app.config import settings
@@ -14,6 +17,23 @@ logger = logging.getLogger(__name__)
 # Global scheduler instance
 scheduler = AsyncIOScheduler()
 
+# Automatic submission started by the last extraction run (if any)
+_submission_task: Optional[asyncio.Task] = None
+
+# How long shutdown waits for an in-flight automatic submission before
+# cancelling it (kept under Docker's default 10s stop timeout)
+SUBMISSION_SHUTDOWN_GRACE_SECONDS = 5
+
+
+async def _submit_pending():
+    """Submit pending content in the background after an extraction run"""
+    try:
+        submission_service = SubmissionService(database.db)
+        submission_result = await submission_service.submit_pending_content()
+        logger.info(f"Automatic submission complete: {submission_result}")
+    except Exception as e:
+        logger.error(f"Error in automatic submission: {e}")
+
 
 async def scheduled_extraction():
     """
@@ -22,20 +42,26 @@ async def scheduled_extraction():
 
     Flow:
     1. Extract content from all sources
-    2. If AUTO_SUBMIT_ENABLED=true: Automatically submit pending verification requests to AletheiaFact
+    2. If AUTO_SUBMIT_ENABLED=true: Start a background task that submits pending
+       verification requests to AletheiaFact, so slow submissions don't delay the
+       next extraction tick
 
     Protected by APScheduler's max_instances=1 to prevent concurrent execution.
+    A new submission is not started while the previous one is still running.
     """
+    global _submission_task
+
     try:
         logger.info("Starting scheduled extraction...")
         extraction_result = await extract_all_sources(database.db)
         logger.info(f"Scheduled extraction complete: {extraction_result}")
 
         if settings.auto_submit_enabled:
-            logger.info("Starting automatic submission of pending content (AUTO_SUBMIT_ENABLED=true)...")
-            submission_service = SubmissionService(database.db)
-            submission_result = await submission_service.submit_pending_content()
-            logger.info(f"Automatic submission complete: {submission_result}")
+            if _submission_task is not None and not _submission_task.done():
+                logger.info("Previous automatic submission still running, skipping this cycle")
+            else:
+                logger.info("Starting automatic submission of pending content (AUTO_SUBMIT_ENABLED=true)...")
+                _submission_task = asyncio.create_task(_submit_pending())
         else:
             logger.info("Automatic submission skipped (AUTO_SUBMIT_ENABLED=false). Use manual submission via API or dashboard.")
 
@@ -85,10 +111,28 @@ def start_scheduler():
         raise
 
 
-def shutdown_scheduler():
-    """Shutdown the scheduler gracefully"""
+async def shutdown_scheduler():
+    """
+    Shutdown the scheduler gracefully.
+
+    An automatic submission still in progress gets a short grace period to
+    finish, then is cancelled and awaited, so it has stopped before the
+    database and HTTP clients are closed.
+    """
     try:
         scheduler.shutdown(wait=True)
+        if _submission_task is not None and not _submission_task.done():
+            logger.info("Waiting for automatic submission to finish...")
+            try:
+                await asyncio.wait_for(
+                    asyncio.shield(_submission_task),
+                    timeout=SUBMISSION_SHUTDOWN_GRACE_SECONDS
+                )
+            except asyncio.TimeoutError:
+                logger.warning("Automatic submission still running, cancelling")
+                _submission_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await _submission_task
         logger.info("Scheduler shutdown complete")
     except Exception as e:
         logger.error(f"Error shutting down scheduler: {e}")
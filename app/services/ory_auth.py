@@ -5,6 +5,7 @@ import time
 import base64
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
+from urllib.parse import urlencode
 import logging
 
 from app.config import settings
@@ -21,11 +22,28 @@ class OryAuthService:
         self.client_secret = settings.ory_client_secret
         self.scope = settings.ory_scope
 
+        # Credentials and scope don't change at runtime, so build the token
+        # request headers (Basic Authentication, client_secret_basic) and
+        # form body once
+        credentials = f"{self.client_id}:{self.client_secret}"
+        encoded_credentials = base64.b64encode(credentials.encode()).decode()
+        self._token_headers = {
+            "Content-Type": "application/x-www-form-urlencoded",
+            "Authorization": f"Basic {encoded_credentials}"
+        }
+        self._token_body = urlencode({
+            "grant_type": "client_credentials",
+            "scope": self.scope,
+        }).encode()
+
         # Token caching
         self._access_token: Optional[str] = None
-        self._token_expires_at: Optional[datetime] = None
+        self._token_expires_at: Optional[float] = None  # time.monotonic() deadline
         self._token_lock = asyncio.Lock()
 
+        # Shared HTTP client, reused across token requests (keep-alive)
+        self._client: Optional[httpx.AsyncClient] = None
+
     async def get_access_token(self) -> str:
         """
         Get a valid access token, refreshing if necessary.
@@ -36,7 +54,14 @@ class OryAuthService:
         Raises:
             Exception: If token generation fails
         """
+        # Fast path: a cached token needs no lock, so concurrent callers
+        # don't queue behind each other
+        if self._is_token_valid():
+            logger.debug("Using cached OAuth2 token")
+            return self._access_token
+
         async with self._token_lock:
+            # Another caller may have refreshed while we waited for the lock
             if self._is_token_valid():
                 logger.debug("Using cached OAuth2 token")
                 return self._access_token
@@ -51,11 +76,12 @@ class OryAuthService:
         Returns:
             True if token is valid and has >60s before expiry
         """
-        if not self._access_token or not self._token_expires_at:
+        if not self._access_token or self._token_expires_at is None:
             return False
 
-        # Add 60 second buffer before expiry
-        return datetime.utcnow() < (self._token_expires_at - timedelta(seconds=60))
+        # Add 60 second buffer before expiry (monotonic clock, so wall-clock
+        # adjustments can't extend or cut short a token's lifetime)
+        return time.monotonic() < self._token_expires_at - 60
 
     async def _generate_client_credentials_token(self) -> str:
         """
@@ -67,68 +93,54 @@ class OryAuthService:
         Raises:
             Exception: If token generation fails
         """
-        # Use Basic Authentication (client_secret_basic)
-        credentials = f"{self.client_id}:{self.client_secret}"
-        encoded_credentials = base64.b64encode(credentials.encode()).decode()
-
-        form_data = {
-            "grant_type": "client_credentials",
-            "scope": self.scope,
-        }
-
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Authorization": f"Basic {encoded_credentials}"
-        }
-
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                start_time = time.time()
-                response = await client.post(
-                    f"{self.ory_cloud_url}/oauth2/token",
-                    headers=headers,
-                    data=form_data
-                )
-
-                duration = time.time() - start_time
-                logger.info(
-                    f"OAuth2 token request completed in {duration:.2f}s",
+            client = self._get_client()
+            start_time = time.time()
+            response = await client.post(
+                f"{self.ory_cloud_url}/oauth2/token",
+                headers=self._token_headers,
+                content=self._token_body
+            )
+
+            duration = time.time() - start_time
+            logger.info(
+                f"OAuth2 token request completed in {duration:.2f}s",
+                extra={
+                    "endpoint": "/oauth2/token",
+                    "method": "POST",
+                    "status_code": response.status_code,
+                    "duration": duration
+                }
+            )
+
+            if response.status_code != 200:
+                error_detail = response.text
+                logger.error(
+                    "Failed to generate OAuth2 token",
                     extra={
-                        "endpoint": "/oauth2/token",
-                        "method": "POST",
                         "status_code": response.status_code,
-                        "duration": duration
+                        "response": error_detail
                     }
                 )
+                raise Exception(f"OAuth2 token generation failed: {response.status_code} - {error_detail}")
 
-                if response.status_code != 200:
-                    error_detail = response.text
-                    logger.error(
-                        "Failed to generate OAuth2 token",
-                        extra={
-                            "status_code": response.status_code,
-                            "response": error_detail
-                        }
-                    )
-                    raise Exception(f"OAuth2 token generation failed: {response.status_code} - {error_detail}")
-
-                token_data = response.json()
-
-                # Cache the token
-                self._access_token = token_data["access_token"]
-                expires_in = token_data.get("expires_in", 3600)  # Default 1 hour
-                self._token_expires_at = datetime.utcnow() + timedelta(seconds=expires_in)
-
-                logger.info(
-                    "Successfully generated OAuth2 token",
-                    extra={
-                        "expires_in": expires_in,
-                        "token_type": token_data.get("token_type", "bearer"),
-                        "expires_at": self._token_expires_at.isoformat()
-                    }
-                )
+            token_data = response.json()
 
-                return self._access_token
+            # Cache the token
+            self._access_token = token_data["access_token"]
+            expires_in = token_data.get("expires_in", 3600)  # Default 1 hour
+            self._token_expires_at = time.monotonic() + expires_in
+
+            logger.info(
+                "Successfully generated OAuth2 token",
+                extra={
+                    "expires_in": expires_in,
+                    "token_type": token_data.get("token_type", "bearer"),
+                    "expires_at": (datetime.utcnow() + timedelta(seconds=expires_in)).isoformat()
+                }
+            )
+
+            return self._access_token
 
         except httpx.TimeoutException:
             logger.error("Timeout while generating OAuth2 token")
@@ -140,6 +152,23 @@ class OryAuthService:
             logger.error(f"Error generating OAuth2 token: {e}")
             raise
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, creating it on first use.
+
+        Returns:
+            httpx.AsyncClient reused for all Ory requests
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=30.0)
+        return self._client
+
+    async def aclose(self):
+        """Close the shared HTTP client (called on application shutdown)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     def clear_cache(self):
         """Clear cached token (useful for testing or forced refresh)"""
         self._access_token = None
@@ -1,5 +1,6 @@
 """Service for submitting content to AletheiaFact"""
-from datetime import datetime
+import asyncio
+from datetime import datetime, timedelta
 from typing import Dict, Optional
 from bson import ObjectId
 import logging
@@ -11,6 +12,21 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Fields read by submit_content_doc and AletheiaClient.create_verification_request
+_SUBMISSION_FIELDS = {
+    'status': 1,
+    'preFilterScore': 1,
+    'sourceName': 1,
+    'sourceUrl': 1,
+    'content': 1,
+    'publishedAt': 1,
+    'extractedAt': 1,
+}
+
+# How long a submission claim blocks other workers; after that the item is
+# considered abandoned (e.g. process killed mid-submission) and can be retried
+_SUBMISSION_CLAIM_TTL = timedelta(minutes=5)
+
 
 class SubmissionService:
     """Handle submission of content to AletheiaFact"""
@@ -45,6 +61,26 @@ class SubmissionService:
                 logger.error(f"Content not found: {content_id}")
                 return False
 
+        except Exception as e:
+            logger.error(f"Error in submit_content for {content_id}: {e}")
+            return False
+
+        return await self.submit_content_doc(content)
+
+    async def submit_content_doc(self, content: Dict) -> bool:
+        """
+        Submit an already-loaded content document to AletheiaFact.
+
+        Args:
+            content: Content document as stored in extracted_content
+
+        Returns:
+            True if submission successful, False otherwise
+        """
+        content_oid = content['_id']
+        content_id = str(content_oid)
+
+        try:
             # Verify not already submitted
             if content['status'] == ContentStatus.SUBMITTED:
                 logger.warning(f"Content already submitted: {content_id}")
@@ -57,12 +93,18 @@ class SubmissionService:
                     f"({settings.submission_score_threshold}): {content_id}"
                 )
                 await self._update_content_status(
-                    content_id,
+                    content_oid,
                     ContentStatus.REJECTED,
                     error="Score below submission threshold"
                 )
                 return False
 
+            # Claim the item so concurrent workers (scheduler batch, manual
+            # submit route) can't send it to AletheiaFact twice
+            if not await self._claim_for_submission(content_oid):
+                logger.warning(f"Content already submitted or being submitted: {content_id}")
+                return False
+
             # Attempt submission to AletheiaFact
             try:
                 vr_response = await self.aletheia_client.create_verification_request(content)
@@ -70,23 +112,26 @@ class SubmissionService:
                 # Extract VR ID from response
                 vr_id = vr_response.get('_id') or vr_response.get('id')
 
-                # Update content status to submitted
-                await self.db.extracted_content.update_one(
-                    {'_id': ObjectId(content_id)},
-                    {
-                        '$set': {
-                            'status': ContentStatus.SUBMITTED,
-                            'verificationRequestId': vr_id,
-                            'submittedToAletheiaAt': datetime.utcnow(),
-                            'submissionError': None,
-                            'updatedAt': datetime.utcnow()
+                # Update content status to submitted and source statistics
+                # (independent collections, so both writes go out together)
+                now = datetime.utcnow()
+                await asyncio.gather(
+                    self.db.extracted_content.update_one(
+                        {'_id': content_oid, 'status': {'$ne': ContentStatus.SUBMITTED}},
+                        {
+                            '$set': {
+                                'status': ContentStatus.SUBMITTED,
+                                'verificationRequestId': vr_id,
+                                'submittedToAletheiaAt': now,
+                                'submissionError': None,
+                                'updatedAt': now
+                            },
+                            '$unset': {'submissionClaimedAt': ''}
                         }
-                    }
+                    ),
+                    self._increment_source_submitted(content['sourceName'])
                 )
 
-                # Update source statistics
-                await self._increment_source_submitted(content['sourceName'])
-
                 logger.info(f"Successfully submitted content {content_id} as VR {vr_id}")
                 return True
 
@@ -96,14 +141,14 @@ class SubmissionService:
 
                 # Update content status to failed
                 await self._update_content_status(
-                    content_id,
+                    content_oid,
                     ContentStatus.FAILED,
                     error=error_msg
                 )
                 return False
 
         except Exception as e:
-            logger.error(f"Error in submit_content for {content_id}: {e}")
+            logger.error(f"Error in submit_content_doc for {content_id}: {e}")
             return False
 
     async def submit_pending_content(self, limit: Optional[int] = None) -> Dict[str, int]:
@@ -126,21 +171,30 @@ class SubmissionService:
                 'preFilterScore': {'$gte': settings.submission_score_threshold}
             }
 
-            pending_content = await self.db.extracted_content.find(query).limit(limit).to_list(None)
+            # Highest-scoring items first when there are more than `limit`
+            pending_content = await self.db.extracted_content.find(
+                query, _SUBMISSION_FIELDS
+            ).sort('preFilterScore', -1).limit(limit).to_list(None)
 
             logger.info(f"Found {len(pending_content)} pending items to submit")
 
-            successful = 0
-            failed = 0
+            # Submit a bounded number of items at a time (each one waits on
+            # AletheiaFact and MongoDB round-trips)
+            semaphore = asyncio.Semaphore(settings.submission_concurrency)
 
-            for content in pending_content:
-                content_id = str(content['_id'])
-                success = await self.submit_content(content_id)
+            async def submit_one(content: Dict) -> bool:
+                async with semaphore:
+                    # Documents were just loaded by the query above, so
+                    # skip the per-item refetch in submit_content
+                    return await self.submit_content_doc(content)
 
-                if success:
-                    successful += 1
-                else:
-                    failed += 1
+            results = await asyncio.gather(
+                *(submit_one(content) for content in pending_content),
+                return_exceptions=True
+            )
+
+            successful = sum(1 for result in results if result is True)
+            failed = len(results) - successful
 
             logger.info(f"Batch submission complete: {successful} successful, {failed} failed")
 
@@ -159,9 +213,37 @@ class SubmissionService:
                 'error': str(e)
             }
 
+    async def _claim_for_submission(self, content_oid: ObjectId) -> bool:
+        """
+        Atomically mark content as being submitted.
+
+        Succeeds only if the content is not submitted yet and no other
+        worker holds an unexpired claim on it.
+
+        Args:
+            content_oid: Content ObjectId
+
+        Returns:
+            True if this worker now owns the submission, False otherwise
+        """
+        now = datetime.utcnow()
+        claimed = await self.db.extracted_content.find_one_and_update(
+            {
+                '_id': content_oid,
+                'status': {'$ne': ContentStatus.SUBMITTED},
+                '$or': [
+                    {'submissionClaimedAt': None},
+                    {'submissionClaimedAt': {'$lt': now - _SUBMISSION_CLAIM_TTL}}
+                ]
+            },
+            {'$set': {'submissionClaimedAt': now}},
+            projection={'_id': 1}
+        )
+        return claimed is not None
+
     async def _update_content_status(
         self,
-        content_id: str,
+        content_oid: ObjectId,
         status: ContentStatus,
         error: Optional[str] = None
     ):
@@ -169,7 +251,7 @@ class SubmissionService:
         Update content status and error message.
 
         Args:
-            content_id: Content ID
+            content_oid: Content ObjectId
             status: New status
             error: Optional error message
         """
@@ -182,8 +264,8 @@ class SubmissionService:
             update_data['submissionError'] = error
 
         await self.db.extracted_content.update_one(
-            {'_id': ObjectId(content_id)},
-            {'$set': update_data}
+            {'_id': content_oid, 'status': {'$ne': ContentStatus.SUBMITTED}},
+            {'$set': update_data, '$unset': {'submissionClaimedAt': ''}}
         )
 
     async def _increment_source_submitted(self, source_name: str):
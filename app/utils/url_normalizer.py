@@ -1,4 +1,6 @@
 """URL normalization utilities for deduplication"""
+import re
+from functools import lru_cache
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 
 
@@ -10,7 +12,16 @@ TRACKING_PARAMS = {
     '_ga', '_gl',                   # Google Analytics
 }
 
+# Plain http(s) URL with a host and no query, params or fragment:
+# printable ASCII only, so urlparse would neither strip, reject nor
+# rewrite anything
+_SIMPLE_URL_PATTERN = re.compile(r'(https?)://[!-.0-~][!-~]*')
+_SIMPLE_URL_EXCLUDED = frozenset('?#;[]')
 
+
+# Feeds return mostly the same links on every poll, so results are cached
+# (bounded: a few MB at most)
+@lru_cache(maxsize=16384)
 def normalize_url(url: str) -> str:
     """
     Normalize URL by removing tracking parameters and standardizing format.
@@ -34,6 +45,14 @@ def normalize_url(url: str) -> str:
     if not url:
         return url
 
+    # Fast path: most feed links have no query string, so the only change
+    # is the scheme upgrade
+    match = _SIMPLE_URL_PATTERN.fullmatch(url)
+    if match and _SIMPLE_URL_EXCLUDED.isdisjoint(url):
+        if match.group(1) == 'http':
+            return 'https' + url[4:]
+        return url
+
     try:
         # Parse URL components
         parsed = urlparse(url)
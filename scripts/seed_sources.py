@@ -2,16 +2,17 @@
 import asyncio
 import sys
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
 from app.config import settings
 
 # Initial RSS sources for Brazilian news monitoring
-SOURCES = [
+SOURCES = (
     # High Credibility (4 sources)
     {
         "name": "G1",
@@ -148,7 +149,7 @@ SOURCES = [
             }
         }
     }
-]
+)
 
 
 async def seed_sources():
@@ -161,40 +162,49 @@ async def seed_sources():
     print(f"Connected to MongoDB: {settings.database_name}")
     print(f"Seeding {len(SOURCES)} sources (RSS + HTML)...\n")
 
-    inserted_count = 0
-    skipped_count = 0
-
+    # One upsert per source, sent in a single bulk_write. $setOnInsert
+    # only writes when no matching source exists, so existing sources
+    # (and their counters) are left untouched.
+    now = datetime.now(timezone.utc)
+    new_source_fields = {
+        'totalExtracted': 0,
+        'totalSubmitted': 0,
+        'createdAt': now,
+        'updatedAt': now,
+    }
+    operations = []
     for source_data in SOURCES:
-        # Check if source already exists (check by name for HTML sources)
-        if 'rssUrl' in source_data:
-            existing = await db.source_configuration.find_one({
-                'rssUrl': source_data['rssUrl']
-            })
+        # Match by rssUrl, or by name for HTML sources
+        key = 'rssUrl' if 'rssUrl' in source_data else 'name'
+        new_source = {k: v for k, v in source_data.items() if k != key}
+        new_source.update(new_source_fields)
+        operations.append(UpdateOne(
+            {key: source_data[key]},
+            {'$setOnInsert': new_source},
+            upsert=True
+        ))
+
+    result = await db.source_configuration.bulk_write(operations, ordered=False)
+
+    # Collect the report and write it in one go
+    lines = []
+    for index, source_data in enumerate(SOURCES):
+        if index in result.upserted_ids:
+            lines.append(f"✓ Added {source_data['name']} ({source_data['credibilityLevel']})")
         else:
-            existing = await db.source_configuration.find_one({
-                'name': source_data['name']
-            })
-
-        if existing:
-            print(f"⊘ Skipping {source_data['name']} (already exists)")
-            skipped_count += 1
-            continue
-
-        # Add timestamps
-        source_data['totalExtracted'] = 0
-        source_data['totalSubmitted'] = 0
-        source_data['createdAt'] = datetime.utcnow()
-        source_data['updatedAt'] = datetime.utcnow()
-
-        # Insert source
-        result = await db.source_configuration.insert_one(source_data)
-        print(f"✓ Added {source_data['name']} ({source_data['credibilityLevel']})")
-        inserted_count += 1
-
-    print(f"\nSeeding complete!")
-    print(f"  Inserted: {inserted_count}")
-    print(f"  Skipped: {skipped_count}")
-    print(f"  Total: {len(SOURCES)}")
+            lines.append(f"⊘ Skipping {source_data['name']} (already exists)")
+
+    inserted_count = result.upserted_count
+    skipped_count = len(SOURCES) - inserted_count
+
+    lines.extend([
+        "",
+        "Seeding complete!",
+        f"  Inserted: {inserted_count}",
+        f"  Skipped: {skipped_count}",
+        f"  Total: {len(SOURCES)}",
+    ])
+    print("\n".join(lines))
 
     # Close connection
     client.close()